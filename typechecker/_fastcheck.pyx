@@ -0,0 +1,29 @@
+# cython: language_level=3
+"""
+C implementation of the element scanners in `typechecker._scanners`.
+Build it in place with `cythonize -i typechecker/_fastcheck.pyx`. If it is not
+built, the pure Python implementation is used.
+"""
+
+
+def scan_isinstance(seq, type_):
+    """
+    Scan the elements of a container against a type.
+    :param seq: The container to be scanned.
+    :param type_: The expected type of the elements.
+    :return: The index of the first incompatible element, or -1 if all the
+        elements are compatible.
+    """
+    cdef Py_ssize_t idx = 0
+    cdef list items
+    if type(seq) is list:
+        items = seq
+        for idx in range(len(items)):
+            if not isinstance(items[idx], type_):
+                return idx
+        return -1
+    for item in seq:
+        if not isinstance(item, type_):
+            return idx
+        idx += 1
+    return -1
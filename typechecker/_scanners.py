@@ -0,0 +1,31 @@
+import itertools
+import typing
+
+
+def scan_isinstance(seq: typing.Iterable, type_: typing.Type) -> int:
+    """
+    Scan the elements of a container against a type in bulk.
+    The elements are checked by `isinstance` inside a C-level `map` / `all`
+    loop. Only if a mismatch is found, the elements are scanned again one by
+    one to locate the first incompatible one.
+    :param seq: The container to be scanned.
+    :param type_: The expected type of the elements.
+    :return: The index of the first incompatible element, or -1 if all the
+        elements are compatible.
+    """
+    if all(map(isinstance, seq, itertools.repeat(type_))):
+        return -1
+    for idx, item in enumerate(seq):
+        if not isinstance(item, type_):
+            return idx
+    return -1
+
+
+# the pure python implementation, kept reachable if it is overridden below
+_py_scan_isinstance = scan_isinstance
+
+# use the C implementation instead, if the extension is built
+try:
+    from typechecker._fastcheck import scan_isinstance
+except ImportError:
+    pass
@@ -1,9 +1,33 @@
-import collections
 import inspect
+import sys
 import typing
 
+from typechecker._scanners import scan_isinstance
 from typechecker.exceptions import TypeCheckError
 
+# message template of the element type errors, formatted with the index of the
+# element only if the type check fails
+_ELEMENT_ERROR_TEMPLATE = "The #{} element has incompatible type!"
+
+# containers of basic element types shorter than this are checked by an inline
+# `isinstance` loop, since the call overhead of a bulk scan outweighs its
+# faster per element cost there
+_BULK_SCAN_MIN_LENGTH = 16
+
+# `numpy.dtype.kind` codes compatible with the basic element types
+_NDARRAY_DTYPE_KINDS = {
+    bool: 'b',
+    int: 'biu',
+    float: 'f',
+    complex: 'c',
+    str: 'U',
+    bytes: 'S'
+}
+
+# keyword arguments are dispatched by an `if` / `elif` chain up to this number
+# of names in the generated dispatcher, and by a dict lookup beyond it
+_MAX_KEYWORD_BRANCHES = 4
+
 
 class TypeChecker(object):
     """
@@ -11,6 +35,8 @@ class TypeChecker(object):
     `isinstance` function.
     """
 
+    __slots__ = ('_type',)
+
     def __init__(self, type_: typing.Type):
         """
         :param type_: The expected type, presented as type annotation.
@@ -39,9 +65,19 @@ class TupleTypeChecker(TypeChecker):
     elements types.
     """
 
+    __slots__ = ('_elem_checkers', '_elem_messages', '_elem_types',
+                 '_all_basic')
+
     def __init__(self, type_: typing.Type):
         super().__init__(type_)
         self._elem_checkers = tuple(get_type_checker(t) for t in type_.__args__)
+        self._elem_messages = tuple(
+            _ELEMENT_ERROR_TEMPLATE.format(idx)
+            for idx in range(len(self._elem_checkers))
+        )
+        self._elem_types = tuple(_basic_type(c) for c in self._elem_checkers)
+        # if all the elements are of basic types, to be checked in one batch
+        self._all_basic = None not in self._elem_types
 
     def __call__(self, obj: typing.Any) -> typing.Any:
         # check if the object is a tuple
@@ -51,11 +87,19 @@ class TupleTypeChecker(TypeChecker):
         # TODO: Handle ellipsis
         if len(obj) != len(self._elem_checkers):
             self.raise_error(obj, "Length of the tuple mismatch!")
-        # check the element types of the tuple
-        for idx, checker in enumerate(self._elem_checkers):
-            do_type_check(checker,
-                          obj[idx],
-                          "The #{} element has incompatible type!".format(idx))
+        elem_types = self._elem_types
+        # check all the basic element types in a C-level `map` / `all` loop
+        if self._all_basic and all(map(isinstance, obj, elem_types)):
+            return obj
+        # check the element types of the tuple one by one, with everything
+        # used in the loop bound as local variables
+        do = do_type_check
+        checkers = self._elem_checkers
+        messages = self._elem_messages
+        for idx, item in enumerate(obj):
+            elem_type = elem_types[idx]
+            if elem_type is None or not isinstance(item, elem_type):
+                do(checkers[idx], item, messages[idx])
         return obj
 
 
@@ -65,22 +109,59 @@ class ListTypeChecker(TypeChecker):
     element type.
     """
 
+    __slots__ = ('_elem_checker', '_elem_type')
+
+    # if accept 1-D `numpy.ndarray` with a compatible dtype as a list
+    accept_ndarray = False
+
     def __init__(self, type_: typing.Type):
         super().__init__(type_)
         self._elem_checker = get_type_checker(type_.__args__[0])
+        self._elem_type = _basic_type(self._elem_checker)
 
     def __call__(self, obj: typing.Any) -> typing.Any:
         # check if the object is a list
         if not isinstance(obj, list):
-            self.raise_error(obj)
+            if not self._is_compatible_ndarray(obj):
+                self.raise_error(obj)
+            return obj
         # check the element types of the list
         checker = self._elem_checker
-        for idx, item in enumerate(obj):
-            do_type_check(checker,
-                          item,
-                          "The #{} element has incompatible type!".format(idx))
+        elem_type = self._elem_type
+        if elem_type is not None and len(obj) < _BULK_SCAN_MIN_LENGTH:
+            for idx, item in enumerate(obj):
+                if not isinstance(item, elem_type):
+                    do_type_check(checker,
+                                  item,
+                                  (_ELEMENT_ERROR_TEMPLATE, idx))
+        elif elem_type is not None:
+            idx = scan_isinstance(obj, elem_type)
+            if idx >= 0:
+                do_type_check(checker,
+                              obj[idx],
+                              (_ELEMENT_ERROR_TEMPLATE, idx))
+        else:
+            do = do_type_check
+            template = _ELEMENT_ERROR_TEMPLATE
+            for idx, item in enumerate(obj):
+                do(checker, item, (template, idx))
         return obj
 
+    def _is_compatible_ndarray(self, obj: typing.Any) -> bool:
+        """
+        Check if the object is a 1-D `numpy.ndarray` whose dtype is compatible
+        with the basic element type. The elements are not checked one by one.
+        `numpy` is never imported here, as an array can only exist if it has
+        been imported already.
+        """
+        if not self.accept_ndarray:
+            return False
+        numpy = sys.modules.get('numpy')
+        if numpy is None or not isinstance(obj, numpy.ndarray):
+            return False
+        kinds = _NDARRAY_DTYPE_KINDS.get(self._elem_type, ())
+        return obj.ndim == 1 and obj.dtype.kind in kinds
+
 
 class DictTypeChecker(TypeChecker):
     """
@@ -88,25 +169,39 @@ class DictTypeChecker(TypeChecker):
     key and value types.
     """
 
+    __slots__ = ('_key_checker', '_val_checker', '_key_type', '_val_type')
+
     def __init__(self, type_: typing.Type):
         super().__init__(type_)
         self._key_checker = get_type_checker(type_.__args__[0])
         self._val_checker = get_type_checker(type_.__args__[1])
+        self._key_type = _basic_type(self._key_checker)
+        self._val_type = _basic_type(self._val_checker)
 
     def __call__(self, obj: typing.Any) -> typing.Any:
         # check if the object is a list
         if not isinstance(obj, dict):
             self.raise_error(obj)
-        # check the element types of the list
+        key_type = self._key_type
+        val_type = self._val_type
+        # scan the keys and values in bulk if both of them are basic types
+        if (key_type is not None and val_type is not None and
+                len(obj) >= _BULK_SCAN_MIN_LENGTH and
+                scan_isinstance(obj.keys(), key_type) < 0 and
+                scan_isinstance(obj.values(), val_type) < 0):
+            return obj
+        # check the key and value types of the dict, with everything used in
+        # the loop bound as local variables
+        do = do_type_check
         key_checker = self._key_checker
         val_checker = self._val_checker
+        key_message = "Found a key that has incompatible type!"
+        val_message = "Found a value that has incompatible type!"
         for key, val in obj.items():
-            do_type_check(key_checker,
-                          key,
-                          "Found a key that has incompatible type!")
-            do_type_check(val_checker,
-                          val,
-                          "Found a value that has incompatible type!")
+            if key_type is None or not isinstance(key, key_type):
+                do(key_checker, key, key_message)
+            if val_type is None or not isinstance(val, val_type):
+                do(val_checker, val, val_message)
         return obj
 
 
@@ -116,27 +211,71 @@ class SetTypeChecker(TypeChecker):
     element types.
     """
 
+    __slots__ = ('_elem_checker', '_elem_type')
+
     def __init__(self, type_: typing.Type):
         super().__init__(type_)
         self._elem_checker = get_type_checker(type_.__args__[0])
+        self._elem_type = _basic_type(self._elem_checker)
 
     def __call__(self, obj: typing.Any) -> typing.Any:
         if not isinstance(obj, set):
             self.raise_error(obj)
-        # check the element types
         checker = self._elem_checker
-        for idx, item in enumerate(obj):
-            do_type_check(checker,
-                          item,
-                          "Found an element that has incompatible type!")
+        elem_type = self._elem_type
+        if (elem_type is not None and len(obj) >= _BULK_SCAN_MIN_LENGTH and
+                scan_isinstance(obj, elem_type) < 0):
+            return obj
+        # check the element types, with everything used in the loop bound as
+        # local variables
+        do = do_type_check
+        message = "Found an element that has incompatible type!"
+        if elem_type is not None:
+            for item in obj:
+                if not isinstance(item, elem_type):
+                    do(checker, item, message)
+        else:
+            for item in obj:
+                do(checker, item, message)
         return obj
 
 
+class UnionTypeChecker(TypeChecker):
+    """
+    A union type checker that checks if an object matches any of the types.
+    """
+
+    __slots__ = ('_elem_checkers', '_basic_types')
+
+    def __init__(self, type_: typing.Type):
+        super().__init__(type_)
+        elem_checkers = tuple(get_type_checker(t) for t in type_.__args__)
+        # the basic types are checked at once by a single `isinstance` call
+        self._basic_types = tuple(
+            elem_type for elem_type in map(_basic_type, elem_checkers)
+            if elem_type is not None)
+        self._elem_checkers = tuple(
+            checker for checker in elem_checkers
+            if _basic_type(checker) is None)
+
+    def __call__(self, obj: typing.Any) -> typing.Any:
+        if isinstance(obj, self._basic_types):
+            return obj
+        for checker in self._elem_checkers:
+            try:
+                return checker(obj)
+            except TypeCheckError:
+                pass
+        self.raise_error(obj)
+
+
 class EmptyTypeChecker(TypeChecker):
     """
     An empty type checker that does nothing at runtime.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(typing.Any)
 
@@ -148,55 +287,172 @@ class EmptyTypeChecker(TypeChecker):
 EmptyTypeChecker = EmptyTypeChecker()
 
 
-def get_type_checker(type_: typing.Type) -> TypeChecker:
+# types that are not checked at all
+_EMPTY_SENTINELS = frozenset({None, typing.Any, typing.NoReturn})
+
+# unsubscripted variadic aliases (e.g. `typing.Tuple`) are generic aliases
+# until python 3.8, and the class is gone since python 3.9
+_VARIADIC_GENERIC_ALIAS = getattr(typing, '_VariadicGenericAlias', ())
+
+# type checkers of the generic aliases, by their origins
+_ALIAS_CHECKERS = {
+    tuple: TupleTypeChecker,
+    list: ListTypeChecker,
+    dict: DictTypeChecker,
+    set: SetTypeChecker,
+    typing.Union: UnionTypeChecker
+}
+
+
+def create_type_checker(type_: typing.Type) -> TypeChecker:
     """
-    A dynamic dispatch for type checker creation.
+    Create the type checker for a type. The most common cases are dispatched
+    first.
     :param type_: The target type
     :return: The type checker for the dispatch.
     """
+    if type_ in _EMPTY_SENTINELS:
+        return EmptyTypeChecker
 
-    def create_type_checker(type_: typing.Type) -> TypeChecker:
-        if isinstance(type_, typing._VariadicGenericAlias):
-            return TypeChecker(type_)
+    # plain classes
+    if isinstance(type_, type):
+        return TypeChecker(type_)
 
-        if isinstance(type_, typing._GenericAlias):
-            alias_checkers = {
-                tuple: TupleTypeChecker,
-                list: ListTypeChecker,
-                dict: DictTypeChecker,
-                set: SetTypeChecker
-            }
-            origin = type_.__origin__
-            if origin in alias_checkers:
-                return alias_checkers[origin](type_)
+    # generic aliases, except the unsubscripted variadic ones
+    if (isinstance(type_, typing._GenericAlias) and
+            not isinstance(type_, _VARIADIC_GENERIC_ALIAS)):
+        checker_cls = _ALIAS_CHECKERS.get(type_.__origin__)
+        if checker_cls is not None:
+            return checker_cls(type_)
 
-        if type_ == typing.Any or type_ == typing.NoReturn or type_ is None:
-            return EmptyTypeChecker
+    return TypeChecker(type_)
 
-        return TypeChecker(type_)
 
+def get_type_checker(type_: typing.Type) -> TypeChecker:
+    """
+    A dynamic dispatch for type checker creation, cached by the type.
+    :param type_: The target type
+    :return: The type checker for the dispatch.
+    """
     cache = get_type_checker._cache
-    if type_ not in cache:
-        cache[type_] = create_type_checker(type_)
-    return cache[type_]
+    key = _type_key(type_)
+    checker = cache.get(key)
+    if checker is None:
+        checker = cache[key] = create_type_checker(type_)
+    return checker
 
 
 get_type_checker._cache = {}
 
 
-def do_type_check(checker: TypeChecker, obj: typing.Any, message: str) -> \
-        typing.Any:
+def _type_key(type_: typing.Type) -> typing.Hashable:
+    """
+    Form the cache key of a type annotation.
+    Hashing / comparing generic aliases goes through the slow `__hash__` /
+    `__eq__` of the `typing` module, so they are fingerprinted by their
+    class, and the ids of their origin and arguments instead. The annotations
+    are kept alive by the cached type checkers, so the ids are never reused.
+    Other annotations are their own keys.
+    :param type_: The type annotation.
+    :return: The cache key.
+    """
+    if isinstance(type_, typing._GenericAlias):
+        return (type(type_), id(type_.__origin__),
+                tuple(map(id, type_.__args__)))
+    return type_
+
+
+def _basic_type(checker: TypeChecker) -> typing.Optional[typing.Type]:
+    """
+    Get the expected type of a basic type checker, so that its check can be
+    inlined as an `isinstance` call on the hot paths.
+    :param checker: The type checker.
+    :return: The expected type, or `None` if the checker is not a basic one.
+    """
+    return checker._type if type(checker) is TypeChecker else None
+
+
+def do_type_check(checker: TypeChecker, obj: typing.Any,
+                  message: typing.Union[str, typing.Tuple]) -> typing.Any:
     """
     A utility function to form the trace of the type checking error.
     :param checker: Typechekcer to be used.
     :param obj: The object to be checked.
-    :param message: The error message to print on current level.
+    :param message: The error message to print on current level. It can also
+        be a tuple of a message template and its arguments, which is only
+        formatted if the type check fails.
     :return: The object for type checking.
     """
+    if checker is EmptyTypeChecker:
+        return obj
     try:
         return checker(obj)
     except TypeCheckError as err:
-        raise TypeCheckError(message) from err
+        # the same error is raised through all the levels, with the message of
+        # each level added to it
+        if not isinstance(message, str):
+            message = message[0].format(*message[1:])
+        err.add_context(message)
+        raise
+
+
+def _check_default(checker: TypeChecker, default: typing.Any,
+                   message: str) -> None:
+    """
+    Check the type of an argument default at decoration.
+    The default is not checked if the annotation can not be checked by
+    `isinstance`, e.g. a string annotation of a forward reference, so that
+    the function can still be called with the argument omitted.
+    :param checker: The type checker of the argument.
+    :param default: The argument default.
+    :param message: The error message of an incompatible default.
+    :return: None.
+    """
+    try:
+        do_type_check(checker, default, message)
+    except TypeCheckError:
+        raise
+    except TypeError:
+        pass
+
+
+def _get_argspec(func: typing.Callable) -> inspect.FullArgSpec:
+    """
+    Get the argspec of a function directly from its code object, which is
+    much cheaper than `inspect.getfullargspec` building a full signature.
+    Callables without code objects fall back to `inspect.getfullargspec`.
+    :param func: The target function.
+    :return: The argspec, same as the one of `inspect.getfullargspec`.
+    """
+    try:
+        code = func.__code__
+    except AttributeError:
+        return inspect.getfullargspec(func)
+    num_args = code.co_argcount
+    num_kwonlyargs = code.co_kwonlyargcount
+    names = code.co_varnames
+    args = list(names[:num_args])
+    kwonlyargs = list(names[num_args:num_args + num_kwonlyargs])
+    idx = num_args + num_kwonlyargs
+    varargs = None
+    if code.co_flags & inspect.CO_VARARGS:
+        varargs = names[idx]
+        idx += 1
+    varkw = None
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        varkw = names[idx]
+    return inspect.FullArgSpec(args=args,
+                               varargs=varargs,
+                               varkw=varkw,
+                               defaults=func.__defaults__,
+                               kwonlyargs=kwonlyargs,
+                               kwonlydefaults=func.__kwdefaults__,
+                               annotations=dict(func.__annotations__))
+
+
+# layouts of the function call type checkers, keyed by the argument names,
+# the annotation cache keys and the settings
+_layout_cache = {}
 
 
 class FuncCallTypeChecker(object):
@@ -205,6 +461,12 @@ class FuncCallTypeChecker(object):
     typing annotations at runtime.
     """
 
+    __slots__ = ('_func', '_check_args', '_check_return', '_arg_names',
+                 '_arg_checkers', '_arg_checker_seq', '_kw_checkers',
+                 '_named_checkers', '_varg_checker', '_vkw_checker',
+                 '_ret_checker', '_is_noop', '_arg_defaults', '_kw_defaults',
+                 '_dispatch', '_settings', '__weakref__')
+
     def __init__(self, func: typing.Callable, *,
                  check_args: bool, check_return: bool, force_annotation: bool):
         """
@@ -218,9 +480,30 @@ class FuncCallTypeChecker(object):
         self._func = func
         self._check_args = check_args
         self._check_return = check_return
+        # the settings as supplied, before they are narrowed by the layout
+        self._settings = (check_args, check_return, force_annotation)
 
         # argspec is a namedtuple. details in `inspect` module documentation
-        argspec = inspect.getfullargspec(func)
+        argspec = _get_argspec(func)
+
+        # get positional argument defaults, which belong to the last
+        # positional arguments
+        arg_defaults = argspec.defaults or []
+        self._arg_defaults = {
+            arg: default
+            for arg, default in
+            zip(argspec.args[-len(arg_defaults):], arg_defaults)
+        }
+        self._kw_defaults = argspec.kwonlydefaults or {}
+
+        # an argument with a `None` default is implicitly optional. it is a
+        # rule of this library, as `typing.get_type_hints` only does so until
+        # python 3.10
+        annotations = dict(argspec.annotations)
+        for defaults in (self._arg_defaults, self._kw_defaults):
+            for name, default in defaults.items():
+                if default is None and name in annotations:
+                    annotations[name] = typing.Optional[annotations[name]]
 
         def create_checker(arg_name: str):
             """
@@ -228,7 +511,7 @@ class FuncCallTypeChecker(object):
             Otherwise create a `EmptyChecker` to avoid type check.
             """
             try:
-                annotation = argspec.annotations.get(arg_name)
+                annotation = annotations.get(arg_name)
             except KeyError:
                 if force_annotation:
                     raise TypeError('Function "{}" must be fully '
@@ -236,54 +519,241 @@ class FuncCallTypeChecker(object):
                 annotation = None
             return get_type_checker(annotation)
 
-        def create_checker_dict(arg_name_list: typing.Sequence[str]) \
-                -> typing.Mapping[str, TypeChecker]:
-            """
-            Create a ordered dict mapping from positional / keyword-only
-            argument names to their corresponding type checkers.
-            """
-            return collections.OrderedDict(
-                (arg_name, create_checker(arg_name)) for arg_name in
-                arg_name_list
+        # the checker layout is shared by the functions with identical
+        # argument names, annotations and settings
+        layout_key = (
+            tuple(argspec.args),
+            tuple(argspec.kwonlyargs),
+            argspec.varargs,
+            argspec.varkw,
+            tuple(_type_key(annotations.get(name)) for name in
+                  (*argspec.args, *argspec.kwonlyargs,
+                   argspec.varargs, argspec.varkw, 'return')),
+            check_args,
+            check_return
+        )
+        layout = _layout_cache.get(layout_key)
+        if layout is None:
+            # positional argument names, in the order of the function signature
+            self._arg_names = tuple(argspec.args)
+            arg_checkers = tuple(
+                create_checker(arg_name) for arg_name in self._arg_names)
+            # positional argument type checkers by name, for keyword arguments
+            self._arg_checkers = dict(zip(self._arg_names, arg_checkers))
+            # (index, checker) pairs of the positional arguments to be checked,
+            # the ones with empty type checkers are excluded
+            self._arg_checker_seq = tuple(
+                (idx, checker) for idx, checker in enumerate(arg_checkers)
+                if checker is not EmptyTypeChecker
             )
-
-        # positional argument type checkers
-        self._arg_checkers = create_checker_dict(argspec.args)
-        # keyword-only argument type checkers
-        self._kw_checkers = create_checker_dict(argspec.kwonlyargs)
-        # *args (variadic positional-only arguments) type checker
-        self._varg_checker = create_checker(argspec.varargs)
-        # **kwargs (variadic keyword-only arguments) type checker
-        self._vkw_checker = create_checker(argspec.varkw)
-        # return type checker
-        self._ret_checker = create_checker('return')
-
-        # get positional argument defaults
-        arg_defaults = argspec.defaults or []
-        self._arg_defaults = {
-            arg: default
-            for arg, default in
-            zip(argspec.args[-len(arg_defaults):0], arg_defaults)
-        }
-        # check positional argument defaults types at initialization
+            # keyword-only argument type checkers
+            self._kw_checkers = {
+                arg_name: create_checker(arg_name)
+                for arg_name in argspec.kwonlyargs
+            }
+            # positional and keyword-only argument type checkers, for keyword
+            # arguments to be looked up once in a single dict
+            self._named_checkers = dict(self._arg_checkers)
+            self._named_checkers.update(self._kw_checkers)
+            # *args (variadic positional-only arguments) type checker
+            self._varg_checker = create_checker(argspec.varargs)
+            # **kwargs (variadic keyword-only arguments) type checker
+            self._vkw_checker = create_checker(argspec.varkw)
+            # return type checker
+            self._ret_checker = create_checker('return')
+            # no need to check the return if it is not annotated
+            self._check_return = (check_return and
+                                  self._ret_checker is not EmptyTypeChecker)
+            # if neither the arguments nor the return would be checked at call
+            self._is_noop = not self._check_return and (
+                not self._check_args or
+                all(checker is EmptyTypeChecker for checker in
+                    (*self._named_checkers.values(),
+                     self._varg_checker,
+                     self._vkw_checker))
+            )
+            dispatch_factory = self._build_dispatch_factory()
+            _layout_cache[layout_key] = (
+                self._arg_names,
+                self._arg_checkers,
+                self._arg_checker_seq,
+                self._kw_checkers,
+                self._named_checkers,
+                self._varg_checker,
+                self._vkw_checker,
+                self._ret_checker,
+                self._check_return,
+                self._is_noop,
+                dispatch_factory
+            )
+        else:
+            (self._arg_names,
+             self._arg_checkers,
+             self._arg_checker_seq,
+             self._kw_checkers,
+             self._named_checkers,
+             self._varg_checker,
+             self._vkw_checker,
+             self._ret_checker,
+             self._check_return,
+             self._is_noop,
+             dispatch_factory) = layout
+
+        # check positional argument defaults types at initialization. the
+        # defaults never change, and the dispatcher only checks the supplied
+        # arguments, so they are not checked again at call
         for name, default in self._arg_defaults.items():
-            do_type_check(
+            _check_default(
                 self._arg_checkers[name],
                 default,
                 'Positional argument "{}" has '
                 'an incompatible default value!'.format(name)
             )
 
-        self._kw_defaults = argspec.kwonlydefaults or {}
         # check keyword-only argument defaults types at initialization
         for name, default in self._kw_defaults.items():
-            do_type_check(
+            _check_default(
                 self._kw_checkers[name],
                 default,
                 'Keyword-only argument "{}" has '
                 'an incompatible default value!'.format(name)
             )
 
+        # the type checked function specialized for the function signature
+        self._dispatch = dispatch_factory(func)
+
+    def _build_dispatch_factory(self) -> typing.Callable:
+        """
+        Generate a dispatcher factory specialized for the function signature.
+        The positional indices and the keyword names are hardcoded in the
+        generated code, and every checker / message is bound as a closure
+        variable of the generated function. Empty type checkers are skipped
+        entirely, and basic type checkers are inlined as `isinstance` calls.
+        The factory only binds the target function, so that it can be shared
+        by the functions with identical signatures.
+        :return: The factory that takes the target function, and returns the
+            type checked function, a plain `(*args, **kwargs)` function that
+            checks the call and calls the target function.
+        """
+        params = {'_do': do_type_check}
+        body = []
+
+        def bind(value: typing.Any) -> str:
+            """
+            Bind a value as a closure variable of the generated function.
+            """
+            name = '_v{}'.format(len(params))
+            params[name] = value
+            return name
+
+        def emit_check(checker: TypeChecker, value: str, message: str,
+                       indent: str) -> None:
+            """
+            Emit the code that checks the `value` expression with `checker`.
+            A basic type checker is inlined as an `isinstance` call, and
+            `do_type_check` is only called to raise the error.
+            """
+            checker_name = bind(checker)
+            basic_type = _basic_type(checker)
+            if basic_type is not None:
+                body.append('{}if not isinstance({}, {}):'.format(
+                    indent, value, bind(basic_type)))
+                indent += '    '
+            body.append('{}_do({}, {}, {})'.format(
+                indent, checker_name, value, message))
+
+        if self._check_args:
+            num_args = len(self._arg_names)
+            arg_checks = [
+                (idx, checker, bind('Positional argument "{}" '
+                                    'takes a incompatible value!'.format(
+                                        self._arg_names[idx])))
+                for idx, checker in self._arg_checker_seq
+            ]
+            has_varg = self._varg_checker is not EmptyTypeChecker
+            if arg_checks or has_varg:
+                # if all the positional arguments are supplied, check them
+                # without bound checks, and check the rest against the *args
+                # argument (variadic positional argument) type.
+                body.append('    n = len(args)')
+                body.append('    if n >= {}:'.format(num_args))
+                for idx, checker, message in arg_checks:
+                    emit_check(checker,
+                               'args[{}]'.format(idx),
+                               message,
+                               '        ')
+                if has_varg:
+                    body.append('        for i in range({}, n):'.format(
+                        num_args))
+                    emit_check(self._varg_checker,
+                               'args[i]',
+                               '({}, i)'.format(
+                                   bind('#{} positional argument '
+                                        'takes a incompatible value')),
+                               '            ')
+                # otherwise, only check the supplied positional arguments
+                if arg_checks:
+                    body.append('    else:')
+                    for idx, checker, message in arg_checks:
+                        body.append('        if n > {}:'.format(idx))
+                        emit_check(checker,
+                                   'args[{}]'.format(idx),
+                                   message,
+                                   '            ')
+
+            # check keyword argument types, first against positional /
+            # keyword-only arguments, second against the **kwargs argument.
+            named_checkers = list(self._named_checkers.items())
+            if self._vkw_checker is EmptyTypeChecker:
+                named_checkers = [(name, checker)
+                                  for name, checker in named_checkers
+                                  if checker is not EmptyTypeChecker]
+            message = '({}, k)'.format(
+                bind('Keyword argument "{}" '
+                     'takes a incompatible value!'))
+            if len(named_checkers) > _MAX_KEYWORD_BRANCHES:
+                body.append('    for k, v in kwargs.items():')
+                body.append('        _do({}(k, {}), v, {})'.format(
+                    bind(self._named_checkers.get),
+                    bind(self._vkw_checker),
+                    message))
+            elif named_checkers or self._vkw_checker is not EmptyTypeChecker:
+                body.append('    for k, v in kwargs.items():')
+                keyword = 'if'
+                for name, checker in named_checkers:
+                    body.append('        {} k == {!r}:'.format(keyword, name))
+                    keyword = 'elif'
+                    if checker is EmptyTypeChecker:
+                        body.append('            pass')
+                    else:
+                        emit_check(checker, 'v', message, '            ')
+                if self._vkw_checker is not EmptyTypeChecker:
+                    indent = '        '
+                    if named_checkers:
+                        body.append('        else:')
+                        indent += '    '
+                    emit_check(self._vkw_checker, 'v', message, indent)
+
+        if self._check_return:
+            body.append('    ret = _func(*args, **kwargs)')
+            emit_check(self._ret_checker,
+                       'ret',
+                       bind('Return a incompatible value!'),
+                       '    ')
+            body.append('    return ret')
+        else:
+            body.append('    return _func(*args, **kwargs)')
+
+        source = ('def _make_dispatch(_func, {}):\n'
+                  '    def type_checked(*args, **kwargs):\n'
+                  '{}\n'
+                  '    return type_checked\n').format(
+            ', '.join('{0}={0}'.format(name) for name in params),
+            '\n'.join('    ' + line for line in body))
+        namespace = dict(params)
+        exec(compile(source, '<typecheck>', 'exec'), namespace)
+        return namespace['_make_dispatch']
+
     def __call__(self, *args, **kwargs):
         """
         Perform type checking at call time and pass through the function call
@@ -292,64 +762,4 @@ class FuncCallTypeChecker(object):
         done. But it is unnecessary (as the `RuntimeError` will be raised by the
         interpreter) and it is not the responsibility of type checking.
         """
-        if self._check_args:
-            arg_idx, num_arg = 0, len(args)
-            # check position argument types
-            for name, checker in self._arg_checkers.items():
-                if arg_idx == num_arg:
-                    break
-                do_type_check(
-                    checker,
-                    args[arg_idx],
-                    'Positional argument "{}" '
-                    'takes a incompatible value!'.format(name)
-                )
-                arg_idx += 1
-
-            # all the unchecked positional arguments will be checked against
-            # the *args argument (variadic positional argument) type.
-            # if redundant positional arguments are supplied, but there is no
-            # *args argument (get an empty checker), then these arguments won't
-            # be checked.
-            checker = self._varg_checker
-            while arg_idx != num_arg:
-                do_type_check(
-                    checker,
-                    args[arg_idx],
-                    "#{} positional argument "
-                    "takes a incompatible value".format(arg_idx)
-                )
-                arg_idx += 1
-
-            # check keyword argument types
-            for name, value in kwargs.items():
-                # first, check against positional arguments
-                if name in self._arg_checkers:
-                    checker = self._arg_checkers[name]
-                # second, check against keyword-only arguments
-                elif name in self._kw_checkers:
-                    checker = self._kw_checkers[name]
-                # third, check against the **kwargs argument
-                # all the unchecked keyword arguments will be checked against
-                # the **kwargs type.
-                # if redundant keyword arguments are supplied, but there is not
-                # **kwargs argument (get an empty checker), then these arguments
-                # won't be checked.
-                else:
-                    checker = self._vkw_checker
-                do_type_check(
-                    checker,
-                    value,
-                    'Keyword argument "{}" '
-                    'takes a incompatible value!'.format(name)
-                )
-
-        ret = self._func(*args, **kwargs)
-
-        if self._check_return:
-            # check return types
-            do_type_check(self._ret_checker,
-                          ret,
-                          'Return a incompatible value!')
-
-        return ret
+        return self._dispatch(*args, **kwargs)
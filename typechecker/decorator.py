@@ -1,7 +1,12 @@
 import functools
+import os
 import typing
 
-from typechecker.checkers import FuncCallTypeChecker
+from typechecker.checkers import FuncCallTypeChecker, ListTypeChecker
+
+# type checking is disabled entirely if the environment variable
+# `TYPECHECKER_DISABLE` is set to "1" before import
+_ENABLED = os.environ.get('TYPECHECKER_DISABLE') != '1'
 
 
 def type_check(func: typing.Callable = None, *,
@@ -12,7 +17,12 @@ def type_check(func: typing.Callable = None, *,
     It works as a decorator or a function to generate a decorator for type
     checking.
     If `func` is supplied, it will decorate the function with type checking.
-    The type checker can be found at the `._type_checker` attribute.
+    The type checker can be found at the `._type_checker` attribute. If there
+    is nothing to be checked at call, the function is returned undecorated.
+    If type checking is disabled by the `TYPECHECKER_DISABLE=1` environment
+    variable, the function is always returned undecorated.
+    The argument defaults are checked once at decoration. An argument with a
+    `None` default is implicitly optional.
     >>> @type_check
     ... def foo(x: int, y: float) -> float:
     ...    return x * y
@@ -35,6 +45,10 @@ def type_check(func: typing.Callable = None, *,
     :return: A decorated function or a decorator, depends on whether `func` 
         argument is supplied.
     """
+    if not _ENABLED:
+        if func is None:
+            return lambda func: func
+        return func
     if func is None:
         def type_check_decorator(func):
             return type_check(func,
@@ -44,21 +58,45 @@ def type_check(func: typing.Callable = None, *,
 
         return type_check_decorator
     else:
+        checker = _get_type_checker(func)
+        if checker is not None:
+            # already decorated with type checking, with the same settings
+            if checker._settings == (check_args, check_return,
+                                     force_annotations):
+                return func
+            # otherwise, decorate the original function with the new settings
+            func = checker._func
         checker = FuncCallTypeChecker(func,
                                       check_args=check_args,
                                       check_return=check_return,
                                       force_annotation=force_annotations)
+        if checker._is_noop:
+            return func
 
-        @functools.wraps(func)
-        def type_checked(*args, **kwargs):
-            return checker(*args, **kwargs)
-
+        # the function generated by the type checker works as the decorated
+        # function itself, avoiding an extra wrapper call
+        type_checked = checker._dispatch
+        functools.update_wrapper(type_checked, func)
         type_checked._type_checker = checker
         return type_checked
 
 
+def _get_type_checker(func: typing.Callable) \
+        -> typing.Optional[FuncCallTypeChecker]:
+    """
+    Get the type checker of a function decorated with type checking.
+    :param func: The function.
+    :return: The type checker, or `None` if the function is not decorated.
+    """
+    checker = getattr(func, '_type_checker', None)
+    if isinstance(checker, FuncCallTypeChecker) and checker._dispatch is func:
+        return checker
+    return None
+
+
 def type_check_setting(*, check_iterator: bool = None,
-                       check_callable: bool = None) -> None:
+                       check_callable: bool = None,
+                       accept_ndarray: bool = None) -> None:
     """
     Global settings for type check. Supply keyword arguments to change them.
     :param check_iterator: If check iterator types or not. If set `True`,
@@ -67,9 +105,15 @@ def type_check_setting(*, check_iterator: bool = None,
     :param check_callable: If check callable types or not. If set `True`,
         the callable will be checked against its annotations. If set `False`,
         the callable will not be checked.
+    :param accept_ndarray: If accept 1-D `numpy.ndarray` as lists or not. If
+        set `True`, an array is accepted by a list type whose element type is
+        a basic numeric / string type, if the dtype of the array is compatible
+        with it. The elements of the array will not be checked one by one.
     :return: None.
     """
     if check_iterator is not None:
         type_check._settings[check_iterator] = check_iterator
     if check_callable is not None:
         type_check._settings[check_callable] = check_callable
+    if accept_ndarray is not None:
+        ListTypeChecker.accept_ndarray = accept_ndarray
@@ -1,8 +1,22 @@
 class TypeCheckError(TypeError):
     """
     The type check error used in the library.
+    The messages of the outer levels are collected while the error propagates
+    through the nested type checks, and only joined when it is printed.
     """
-    pass
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._context = []
+
+    def add_context(self, message: str) -> None:
+        """
+        Add the message of an outer level to the error.
+        """
+        self._context.append(message)
+
+    def __str__(self):
+        return '\n'.join([*reversed(self._context), super().__str__()])
 
 class TypeCheckWarning(RuntimeWarning):
     """
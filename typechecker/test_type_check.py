@@ -0,0 +1,437 @@
+import inspect
+import pickle
+import typing
+import unittest
+from unittest import mock
+
+from typechecker import _scanners, decorator
+from typechecker.checkers import _BULK_SCAN_MIN_LENGTH, FuncCallTypeChecker
+from typechecker.decorator import type_check, type_check_setting
+from typechecker.exceptions import TypeCheckError
+
+
+def mismatch(expect_type: typing.Any, obj: typing.Any) -> str:
+    """
+    The innermost message of a type mismatch.
+    """
+    return 'Expect: "{}".\nActual "{}({})".\n'.format(
+        repr(expect_type), repr(obj.__class__), repr(obj))
+
+
+@type_check
+def basic(a: int, *b: float,
+          c: typing.Tuple[int, float], **d: typing.List[int]) -> float:
+    return a + sum(b) + sum(c) + sum(sum(_) for _ in d.values())
+
+
+@type_check
+def many_keywords(a: int = 0, b: int = 0, c: str = '', d=None, *,
+                  e: float = 0.0, f: int = 0, **g: str) -> None:
+    pass
+
+
+@type_check
+def wrong_return(x) -> int:
+    return x
+
+
+class TestFuncCallTypeChecker(unittest.TestCase):
+
+    def assertTypeCheckError(self, message: str, func: typing.Callable,
+                             *args, **kwargs) -> None:
+        with self.assertRaises(TypeCheckError) as ctx:
+            func(*args, **kwargs)
+        self.assertEqual(str(ctx.exception), message)
+
+    def test_pass(self):
+        self.assertEqual(
+            basic(0, 1.0, 1.5, c=(2, 3.0), d0=[3, 4], d1=[5, 6]), 25.5)
+
+    def test_positional_argument(self):
+        self.assertTypeCheckError(
+            'Positional argument "a" takes a incompatible value!\n' +
+            mismatch(int, 0.0),
+            basic, 0.0, c=(2, 3.0))
+
+    def test_variadic_positional_argument(self):
+        self.assertTypeCheckError(
+            '#2 positional argument takes a incompatible value\n' +
+            mismatch(float, 2),
+            basic, 0, 1.0, 2, c=(2, 3.0))
+
+    def test_keyword_argument(self):
+        self.assertTypeCheckError(
+            'Keyword argument "a" takes a incompatible value!\n' +
+            mismatch(int, 'x'),
+            basic, a='x', c=(2, 3.0))
+        self.assertTypeCheckError(
+            'Keyword argument "d0" takes a incompatible value!\n'
+            'The #1 element has incompatible type!\n' +
+            mismatch(int, 'x'),
+            basic, 0, c=(2, 3.0), d0=[1, 'x'])
+
+    def test_return(self):
+        self.assertEqual(wrong_return(1), 1)
+        self.assertTypeCheckError(
+            'Return a incompatible value!\n' + mismatch(int, 'x'),
+            wrong_return, 'x')
+
+    def test_omitted_positional_arguments(self):
+        @type_check
+        def func(a: int, b: str = '', c: float = 0.0, *d: int) -> None:
+            pass
+
+        func(1)
+        func(1, 'x')
+        func(1, 'x', 1.0, 2, 3)
+        self.assertTypeCheckError(
+            'Positional argument "b" takes a incompatible value!\n' +
+            mismatch(str, 1),
+            func, 1, 1)
+        self.assertTypeCheckError(
+            '#4 positional argument takes a incompatible value\n' +
+            mismatch(int, 1.0),
+            func, 1, 'x', 1.0, 2, 1.0)
+
+    def test_few_keyword_arguments(self):
+        @type_check
+        def func(a: int, b=None, *, c: str = '', **d: float) -> None:
+            pass
+
+        func(a=1, b='any', c='x', d=1.0)
+        self.assertTypeCheckError(
+            'Keyword argument "c" takes a incompatible value!\n' +
+            mismatch(str, 1),
+            func, 1, c=1)
+        self.assertTypeCheckError(
+            'Keyword argument "d" takes a incompatible value!\n' +
+            mismatch(float, 1),
+            func, 1, d=1)
+
+    def test_many_keyword_arguments(self):
+        many_keywords(a=1, b=2, c='x', d=object(), e=1.0, f=3, g='y')
+        self.assertTypeCheckError(
+            'Keyword argument "f" takes a incompatible value!\n' +
+            mismatch(int, 1.0),
+            many_keywords, f=1.0)
+        self.assertTypeCheckError(
+            'Keyword argument "g" takes a incompatible value!\n' +
+            mismatch(str, 1),
+            many_keywords, g=1)
+
+    def test_nested_error_context(self):
+        @type_check
+        def func(x: typing.Dict[str, typing.List[typing.Set[int]]]) -> None:
+            pass
+
+        self.assertTypeCheckError(
+            'Positional argument "x" takes a incompatible value!\n'
+            'Found a value that has incompatible type!\n'
+            'The #1 element has incompatible type!\n'
+            'Found an element that has incompatible type!\n' +
+            mismatch(int, 'x'),
+            func, {'a': [{1}, {'x'}]})
+
+    def test_wrong_default(self):
+        with self.assertRaises(TypeCheckError) as ctx:
+            @type_check
+            def func(a, b: int = 'x') -> None:
+                pass
+        self.assertEqual(
+            str(ctx.exception),
+            'Positional argument "b" has an incompatible default value!\n' +
+            mismatch(int, 'x'))
+        with self.assertRaises(TypeCheckError):
+            @type_check
+            def func(*, c: str = 1) -> None:
+                pass
+
+    def test_uncheckable_default(self):
+        @type_check
+        def func(a: 'int' = 1, b: 'str' = None, *,
+                 c: typing.List['float'] = [1.0]) -> None:
+            pass
+
+        func()
+        func(c=[])
+
+    def test_default_not_checked_at_call(self):
+        checked = []
+
+        class CountedMeta(type):
+            def __instancecheck__(cls, obj):
+                checked.append(obj)
+                return True
+
+        class Counted(metaclass=CountedMeta):
+            pass
+
+        default = object()
+
+        @type_check
+        def func(a: Counted = default) -> None:
+            pass
+
+        self.assertEqual(checked, [default])
+        func()
+        self.assertEqual(checked, [default])
+        func(1)
+        self.assertEqual(checked, [default, 1])
+
+    def test_none_default_is_optional(self):
+        @type_check
+        def func(a: typing.Set[str] = None, *, b: int = None) -> None:
+            pass
+
+        func()
+        func(None, b=None)
+        func({'x'}, b=1)
+        self.assertTypeCheckError(
+            'Positional argument "a" takes a incompatible value!\n' +
+            mismatch(typing.Optional[typing.Set[str]], {1}),
+            func, {1})
+
+    def test_tuple(self):
+        @type_check
+        def func(x: typing.Tuple[int, float, str],
+                 y: typing.Tuple[int, typing.List[int]] = (0, [])) -> None:
+            pass
+
+        func((1, 2.0, 'x'), (1, [2]))
+        self.assertTypeCheckError(
+            'Positional argument "x" takes a incompatible value!\n'
+            'The #1 element has incompatible type!\n' +
+            mismatch(float, 'x'),
+            func, (1, 'x', 'x'))
+        self.assertTypeCheckError(
+            'Positional argument "y" takes a incompatible value!\n'
+            'The #0 element has incompatible type!\n' +
+            mismatch(int, 'x'),
+            func, (1, 2.0, 'x'), ('x', [2]))
+        self.assertTypeCheckError(
+            'Positional argument "y" takes a incompatible value!\n'
+            'The #1 element has incompatible type!\n'
+            'The #0 element has incompatible type!\n' +
+            mismatch(int, 'x'),
+            func, (1, 2.0, 'x'), (1, ['x']))
+
+    def test_long_list(self):
+        @type_check
+        def func(x: typing.List[int]) -> None:
+            pass
+
+        items = list(range(_BULK_SCAN_MIN_LENGTH + 8))
+        func(items)
+        items[_BULK_SCAN_MIN_LENGTH + 4] = 'x'
+        self.assertTypeCheckError(
+            'Positional argument "x" takes a incompatible value!\n'
+            'The #{} element has incompatible type!\n'.format(
+                _BULK_SCAN_MIN_LENGTH + 4) +
+            mismatch(int, 'x'),
+            func, items)
+
+    def test_long_set(self):
+        @type_check
+        def func(x: typing.Set[int]) -> None:
+            pass
+
+        items = set(range(_BULK_SCAN_MIN_LENGTH + 8))
+        func(items)
+        items.add('x')
+        self.assertTypeCheckError(
+            'Positional argument "x" takes a incompatible value!\n'
+            'Found an element that has incompatible type!\n' +
+            mismatch(int, 'x'),
+            func, items)
+
+    def test_long_dict(self):
+        @type_check
+        def func(x: typing.Dict[str, int]) -> None:
+            pass
+
+        items = {str(idx): idx for idx in range(_BULK_SCAN_MIN_LENGTH + 8)}
+        func(items)
+        self.assertTypeCheckError(
+            'Positional argument "x" takes a incompatible value!\n'
+            'Found a key that has incompatible type!\n' +
+            mismatch(str, 1),
+            func, {**items, 1: 1})
+        self.assertTypeCheckError(
+            'Positional argument "x" takes a incompatible value!\n'
+            'Found a value that has incompatible type!\n' +
+            mismatch(int, 'x'),
+            func, {**items, 'x': 'x'})
+
+    def test_union(self):
+        @type_check
+        def func(x: typing.Union[int, str, typing.List[int],
+                                 typing.Set[str]]) -> None:
+            pass
+
+        func(1)
+        func('x')
+        func([1, 2])
+        func({'x'})
+        union = typing.Union[int, str, typing.List[int], typing.Set[str]]
+        for value in (1.0, [1, 'x'], {1}):
+            self.assertTypeCheckError(
+                'Positional argument "x" takes a incompatible value!\n' +
+                mismatch(union, value),
+                func, value)
+
+    def test_shared_layout(self):
+        def first(shared_a: int, shared_b: str = 'x') -> int:
+            return shared_a
+
+        def second(shared_a: int, shared_b: str = 'y') -> int:
+            return shared_b
+
+        def wrong_default(shared_a: int, shared_b: str = 1) -> int:
+            return shared_a
+
+        first, second = type_check(first), type_check(second)
+        self.assertIs(first._type_checker._arg_checkers,
+                      second._type_checker._arg_checkers)
+        self.assertIsNot(first._type_checker._dispatch,
+                         second._type_checker._dispatch)
+        self.assertEqual(first(1), 1)
+        self.assertEqual(first._type_checker._arg_defaults, {'shared_b': 'x'})
+        self.assertEqual(second._type_checker._arg_defaults,
+                         {'shared_b': 'y'})
+        self.assertTypeCheckError(
+            'Return a incompatible value!\n' + mismatch(int, 'y'),
+            second, 1)
+        self.assertTypeCheckError(
+            'Positional argument "shared_b" takes a incompatible value!\n' +
+            mismatch(str, 2),
+            second, 1, 2)
+        with self.assertRaises(TypeCheckError) as ctx:
+            type_check(wrong_default)
+        self.assertEqual(
+            str(ctx.exception),
+            'Positional argument "shared_b" has an incompatible default '
+            'value!\n' + mismatch(str, 1))
+
+    def test_method(self):
+        class Foo(object):
+            @type_check
+            def method(self, x: int) -> int:
+                return x
+
+        self.assertEqual(Foo().method(1), 1)
+        self.assertTypeCheckError(
+            'Positional argument "x" takes a incompatible value!\n' +
+            mismatch(int, 'x'),
+            Foo().method, 'x')
+
+    def test_wrapper_attributes(self):
+        self.assertEqual(basic.__name__, 'basic')
+        self.assertEqual(basic.__qualname__, 'basic')
+        self.assertIsInstance(basic._type_checker, FuncCallTypeChecker)
+        self.assertIs(basic._type_checker._dispatch, basic)
+        self.assertIs(type_check(basic), basic)
+
+    def test_redecorate(self):
+        def func(x: int) -> int:
+            return 'x'
+
+        unchecked_return = type_check(check_return=False)(func)
+        self.assertIs(type_check(check_return=False)(unchecked_return),
+                      unchecked_return)
+        self.assertEqual(unchecked_return(1), 'x')
+        checked = type_check(unchecked_return)
+        self.assertIs(checked.__wrapped__, func)
+        self.assertTypeCheckError(
+            'Return a incompatible value!\n' + mismatch(int, 'x'),
+            checked, 1)
+        self.assertTypeCheckError(
+            'Positional argument "x" takes a incompatible value!\n' +
+            mismatch(int, 'x'),
+            checked, 'x')
+        self.assertIs(type_check(check_args=False, check_return=False)(
+            unchecked_return), func)
+
+    def test_plain_function(self):
+        self.assertTrue(inspect.isfunction(basic))
+        argspec = inspect.getfullargspec(basic)
+        self.assertEqual(argspec.args, [])
+        self.assertEqual(argspec.varargs, 'args')
+        self.assertEqual(argspec.varkw, 'kwargs')
+        self.assertEqual(argspec.kwonlyargs, [])
+        self.assertEqual(inspect.signature(basic),
+                         inspect.signature(basic.__wrapped__))
+        self.assertIn('basic', repr(basic))
+
+    def test_pickle(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertIs(pickle.loads(pickle.dumps(basic, protocol)), basic)
+
+    def test_nothing_to_check(self):
+        def func(a, b=1, *c, **d):
+            pass
+
+        def annotated(a: int) -> int:
+            return a
+
+        self.assertIs(type_check(func), func)
+        self.assertIs(
+            type_check(check_args=False, check_return=False)(annotated),
+            annotated)
+        self.assertIsNot(type_check(annotated), annotated)
+
+    def test_disabled(self):
+        def func(a: int) -> int:
+            return a
+
+        with mock.patch.object(decorator, '_ENABLED', False):
+            self.assertIs(type_check(func), func)
+            self.assertIs(type_check(check_args=False)(func), func)
+
+
+class TestScanIsinstance(unittest.TestCase):
+
+    def test_scan_isinstance(self):
+        # the pure python implementation, and the C one if it is built
+        scanners = {_scanners._py_scan_isinstance, _scanners.scan_isinstance}
+        items = {'a': 0, 'b': 1, 'c': 'x', 'd': 3, 'e': 'y'}
+        for scan in scanners:
+            self.assertEqual(scan([0, 1, 2], int), -1)
+            self.assertEqual(scan([0, 1, 'x', 3, 'y'], int), 2)
+            self.assertEqual(scan([], int), -1)
+            self.assertEqual(scan({0, 1, 2}, int), -1)
+            self.assertEqual(scan({'x'}, int), 0)
+            self.assertEqual(scan(items.keys(), str), -1)
+            self.assertEqual(scan(items.values(), int), 2)
+            self.assertEqual(scan([True, 1.0], (bool, float)), -1)
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestAcceptNdarray(unittest.TestCase):
+
+    def tearDown(self):
+        type_check_setting(accept_ndarray=False)
+
+    def test_accept_ndarray(self):
+        @type_check
+        def func(x: typing.List[float]) -> None:
+            pass
+
+        array = numpy.arange(4, dtype=float)
+        with self.assertRaises(TypeCheckError):
+            func(array)
+        type_check_setting(accept_ndarray=True)
+        func(array)
+        with self.assertRaises(TypeCheckError):
+            func(numpy.arange(4))
+        with self.assertRaises(TypeCheckError):
+            func(numpy.zeros((2, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()